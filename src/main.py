@@ -5,10 +5,12 @@ Entrypoint for the GitHub Action.
 
 import logging
 import os
-import shutil
 import sys
+import zipfile
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 
 from spo_controller import SpoController
 
@@ -24,44 +26,58 @@ logger.addHandler(stdout_handler)
 logger.setLevel(logging.INFO)
 
 
-def manage_spo(tarball_path: str, tarball_name: str) -> None:
+def prepare_spo() -> Optional[tuple]:
     """
-    Wrapper for the SharePoint Online connection.
+    Builds the SharePoint Online controller and performs the Graph handshake
+    so everything is ready to upload. This runs while the archive is still
+    being written.
 
-    Args:
-        tarball_path (str): Path to the tarball to upload.
-        tarball_name (str): Name of the tarball.
+    Returns:
+        Optional[tuple]: The controller and the target directory ID, or None
+                            if the handshake failed.
     """
     logger.info("Beginning the file upload process.")
     spo: SpoController = SpoController()
     if not spo.validate_info():
         logger.error("Skipping upload since environment information is missing.")
-        return
+        return None
     logger.info("Starting a connection to the Microsoft Graph.")
     spo.connect_graph()
     logger.info("Validating that an access token was obtained.")
     if not spo.check_token():
         logger.error("Failed to retrieve a token for SpO. Moving to cleanup.")
-        return
+        return None
 
-    upload_status: bool = False
     logger.info("Getting the directory ID to target for the upload.")
-    logger.debug("Directory is: %s", spo.endpoint.rstrip(":/children/"))
-    dir_id: str = spo.get_dir_id(spo.endpoint.rstrip(":/children/"))
+    dir_id: str = spo.get_dir_id()
     if not dir_id:
         logger.error("Aborting since no directory ID was retrieved.")
-        return
+        return None
+    return (spo, dir_id)
 
-    logging.info("Uploading the file in chunks.")
-    upload_status = spo.upload_file(dir_id, tarball_path, tarball_name)
+
+def manage_spo(
+    spo: SpoController, dir_id: str, tarball_path: str, tarball_name: str
+) -> None:
+    """
+    Wrapper for the SharePoint Online upload and cleanup.
+
+    Args:
+        spo (SpoController): Connected controller to upload through.
+        dir_id (str): ID of the directory to upload to.
+        tarball_path (str): Path to the tarball to upload.
+        tarball_name (str): Name of the tarball.
+    """
+    logger.info("Uploading the file in chunks.")
+    upload_status: bool = spo.upload_file(dir_id, tarball_path, tarball_name)
 
     if upload_status:
-        logging.info("Beginning the SharePoint Online cleanup process.")
+        logger.info("Beginning the SharePoint Online cleanup process.")
         spo.cleanup_files()
     else:
-        logging.info("Ignoring cleanup since the upload was not successful.")
+        logger.info("Ignoring cleanup since the upload was not successful.")
 
-    print("Done with SharePoint Online.")
+    logger.info("Done with SharePoint Online.")
 
 
 def remove_file(file_path: str) -> None:
@@ -79,6 +95,31 @@ def remove_file(file_path: str) -> None:
         logger.error("Unable to find file to delete: %s", file_path)
 
 
+def create_archive(source_dir: str, archive_path: str) -> None:
+    """
+    Creates a zip archive of the given directory in a single streaming pass.
+
+    The archive is deflated at the lowest compression level, which recovers
+    most of the size reduction of the default level at a fraction of its CPU
+    cost, shrinking both the disk spool and the bytes sent over the wire.
+
+    Args:
+        source_dir (str): Directory to archive.
+        archive_path (str): Destination path for the zip file.
+    """
+    with zipfile.ZipFile(
+        archive_path,
+        mode="w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=1,
+        allowZip64=True,
+    ) as archive:
+        for root, _, files in os.walk(source_dir):
+            for file_name in files:
+                full_path: str = os.path.join(root, file_name)
+                archive.write(full_path, os.path.relpath(full_path, source_dir))
+
+
 def check_debug() -> None:
     """
     Determines if debug logging should be enabled.
@@ -113,16 +154,29 @@ def main() -> None:
     validate_dir(ARCHIVE_BASE)
 
     name_base: str = os.environ.get("ARCHIVE_PREFIX", "repo")
-    archive_name: str = f"{name_base}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+    archive_name: str = (
+        f"{name_base}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.zip"
+    )
     archive_path: str = f"{ARCHIVE_BASE}{archive_name}"
 
-    shutil.make_archive(archive_path, "zip", file_path)
+    # Build the archive on a worker thread so the Graph handshake (token
+    # acquisition and directory lookup) overlaps with the disk work. The
+    # future surfaces any exception from the worker; a bare thread would
+    # swallow it and leave a truncated zip behind to be uploaded.
+    logger.info("Building the archive in the background.")
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="archiver") as pool:
+        archiver: Future = pool.submit(create_archive, file_path, archive_path)
+        spo_info: Optional[tuple] = prepare_spo()
+        try:
+            archiver.result()
+        except Exception as error:
+            logger.error("Aborting since archive creation failed: %s", error)
+            remove_file(archive_path)
+            return
     logger.info("Archive created at: %s", archive_path)
 
-    archive_name = f"{archive_name}.zip"
-    archive_path = f"{archive_path}.zip"
-
-    manage_spo(archive_path, archive_name)
+    if spo_info:
+        manage_spo(spo_info[0], spo_info[1], archive_path, archive_name)
     remove_file(archive_path)
 
 
@@ -3,18 +3,39 @@ Module to manage interaction with SharePoint Online.
 """
 import json
 import logging
+import mmap
 import os
+import time
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional
 
+import httpx
 import msal
-import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-CHUNK_SIZE: int = 10485760
+
+# Graph requires upload-session chunks to be a multiple of 320 KiB.
+CHUNK_ALIGNMENT: int = 327680
+MIN_CHUNK_SIZE: int = 10485760
+MAX_CHUNK_SIZE: int = 60 * CHUNK_ALIGNMENT
 DEFAULT_TIMEOUT: int = 10
 MAX_BACKUPS: int = 4
+MAX_PARALLEL_REQUESTS: int = 4
+RETRY_TOTAL: int = 5
+RETRY_BACKOFF: float = 0.5
+RETRY_STATUSES: list = [429, 500, 502, 503, 504]
+# Below this size Graph accepts a single PUT to /content with no upload
+# session.
+SIMPLE_UPLOAD_LIMIT: int = 4194304
+TOKEN_CACHE_PATH: str = "/tmp/archive/.msal_cache.bin"
+DIR_ID_CACHE_PATH: str = "/tmp/archive/.dir_id_cache.json"
 
 logger: logging.Logger = logging.getLogger()
 
@@ -33,6 +54,9 @@ class SpoController:
         graph_token (str): Dictionary containing the token when authenticating to
                             Azure AD.
         client (ConfidentialClientApplication): MSAL client application.
+        session (Client): Persistent HTTP/2 client reused for all Graph calls.
+        token_cache (SerializableTokenCache): MSAL token cache persisted to disk
+                                                between runs.
     """
 
     def __init__(self) -> None:
@@ -41,8 +65,31 @@ class SpoController:
         self.scope: list = [os.environ.get("SPOBKP_SCOPE", "")]
         self.client_id: str = os.environ.get("SPOBKP_CLIENTID", "")
         self.secret: str = os.environ.get("SPOBKP_SECRET", "")
+        self._base_url: str = self.endpoint.split("/root:", maxsplit=1)[0]
+        # The endpoint targets the children listing; the directory itself is
+        # everything before the ":/children" suffix. The old rstrip() call
+        # stripped a character set rather than the suffix and could corrupt
+        # the path.
+        self._dir_endpoint: str = self.endpoint
+        for suffix in (":/children/", ":/children"):
+            if self._dir_endpoint.endswith(suffix):
+                self._dir_endpoint = self._dir_endpoint[: -len(suffix)]
+                break
+        # Listing queries only read these fields, so trim the payload Graph
+        # returns rather than parsing every item property.
+        self._listing_endpoint: str = (
+            f"{self.endpoint}?$select=id,name,createdDateTime"
+        )
         self.graph_token: dict = {}
         self.client: Optional[msal.ConfidentialClientApplication] = None
+        self.token_cache: Optional[msal.SerializableTokenCache] = None
+        self.session: httpx.Client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        self._auth_headers: dict = {}
+        self._stale_dir_id: bool = False
 
     def validate_info(self) -> bool:
         """
@@ -51,11 +98,18 @@ class SpoController:
         Returns:
             bool: Whether or not all required properties are found.
         """
-        for prop in dir(self):
-            if not prop:
+        required: tuple = (
+            ("authority", self.authority),
+            ("endpoint", self.endpoint),
+            ("scope", self.scope[0]),
+            ("client_id", self.client_id),
+            ("secret", self.secret),
+        )
+        for name, value in required:
+            if not value:
                 logger.error(
                     "Missing information for %s property. Aborting SharePoint upload.",
-                    prop,
+                    name,
                 )
                 return False
 
@@ -68,12 +122,42 @@ class SpoController:
         logger.info("Instantiating an MSAL client.")
         logger.debug("Using Client ID: %s", self.client_id)
         logger.debug("Using Authority: %s", self.authority)
+        self.token_cache = msal.SerializableTokenCache()
+        if os.path.exists(TOKEN_CACHE_PATH):
+            logger.debug("Loading the MSAL token cache from: %s", TOKEN_CACHE_PATH)
+            try:
+                with open(TOKEN_CACHE_PATH, "r", encoding="utf-8") as cache_file:
+                    self.token_cache.deserialize(cache_file.read())
+            except (OSError, ValueError):
+                logger.error(
+                    "Unable to load the MSAL token cache. Starting with an "
+                    "empty one."
+                )
+                self.token_cache = msal.SerializableTokenCache()
         self.client = msal.ConfidentialClientApplication(
             client_id=self.client_id,
             authority=self.authority,
             client_credential=self.secret,
+            token_cache=self.token_cache,
         )
 
+    def _persist_token_cache(self) -> None:
+        """
+        Writes the MSAL token cache back to disk if it changed during this run
+        so subsequent runs within the token lifetime skip the AAD round trip.
+        """
+        if not self.token_cache or not self.token_cache.has_state_changed:
+            return
+        logger.debug("Persisting the MSAL token cache to: %s", TOKEN_CACHE_PATH)
+        try:
+            fd: int = os.open(
+                TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                cache_file.write(self.token_cache.serialize())
+        except OSError as error:
+            logger.error("Unable to persist the MSAL token cache: %s", error)
+
     def connect_graph(self) -> None:
         """
         Connects to the Microsoft Graph in order to retrieve a token for future
@@ -94,18 +178,22 @@ class SpoController:
             self.graph_token = result
         else:
             logger.debug("Attempting to retrieve a new MSAL token.")
-            result: Optional[dict] = self.client.acquire_token_for_client(
-                scopes=self.scope
-            )
-            if type(result) == dict and "error" in result:
+            result = self.client.acquire_token_for_client(scopes=self.scope)
+            if isinstance(result, dict) and "error" in result:
                 logger.error(
                     "Received an error retrieving an MSAL token: %s", result["error"]
                 )
             else:
                 logger.debug("Graph token value: %s", result)
-                if type(result) == dict:
+                if isinstance(result, dict):
                     self.graph_token = result
 
+        self._persist_token_cache()
+        if "access_token" in self.graph_token:
+            self._auth_headers = {
+                "Authorization": f"Bearer {self.graph_token['access_token']}"
+            }
+
     def check_token(self) -> bool:
         """
         Ensures that there's a valid token.
@@ -117,6 +205,40 @@ class SpoController:
             return True
         return False
 
+    def _request_with_retry(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Sends a request through the shared client, retrying with exponential
+        backoff on the status codes Graph uses for throttling and transient
+        server errors. A Retry-After header from Graph takes precedence over
+        the computed backoff.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint (str): Endpoint to send the request to.
+
+        Returns:
+            Response: The last response received.
+        """
+        resp: httpx.Response = self.session.request(method, endpoint, **kwargs)
+        for attempt in range(RETRY_TOTAL):
+            if resp.status_code not in RETRY_STATUSES:
+                break
+            try:
+                delay: float = float(resp.headers["Retry-After"])
+            except (KeyError, ValueError):
+                # Retry-After may also be an HTTP-date, which is not worth
+                # parsing here; fall back to the computed backoff.
+                delay = RETRY_BACKOFF * (2**attempt)
+            logger.debug(
+                "Retrying %s with status code %s after %s seconds.",
+                endpoint,
+                resp.status_code,
+                delay,
+            )
+            time.sleep(delay)
+            resp = self.session.request(method, endpoint, **kwargs)
+        return resp
+
     def query_graph(self, endpoint: str = "") -> dict:
         """
         Query the Microsoft Graph at the given endpoint.
@@ -130,13 +252,10 @@ class SpoController:
         if not endpoint:
             endpoint = self.endpoint
         logger.debug("Attempting a connection to: %s", endpoint)
-        resp: requests.Response = requests.get(
+        resp: httpx.Response = self._request_with_retry(
+            "GET",
             endpoint,
-            headers={
-                "Authorization": f"Bearer {self.graph_token['access_token']}",
-                "Content-Type": "application/json",
-            },
-            timeout=DEFAULT_TIMEOUT,
+            headers={**self._auth_headers, "Content-Type": "application/json"},
         )
 
         if not resp.status_code == 200:
@@ -145,6 +264,8 @@ class SpoController:
             )
             return {"error": resp.text, "status": resp.status_code}
 
+        if orjson:
+            return orjson.loads(resp.content)
         return resp.json()
 
     def check_dir(self, name: str, endpoint: str = "") -> dict:
@@ -161,8 +282,8 @@ class SpoController:
             dict: Containing the current state.
         """
         if not endpoint:
-            endpoint = self.endpoint
-        raw_resp: dict = self.query_graph()
+            endpoint = self._listing_endpoint
+        raw_resp: dict = self.query_graph(endpoint)
 
         if "error" in raw_resp.keys():
             return raw_resp
@@ -193,15 +314,11 @@ class SpoController:
         }
         accept: str = "application/json;odata.metadata=minimal;odata.streaming=true;"
         accept += "IEEE754Compatible=false;charset=utf-8"
-        resp: requests.Response = requests.post(
+        resp: httpx.Response = self._request_with_retry(
+            "POST",
             endpoint,
-            headers={
-                "Accept": accept,
-                "Authorization": f"Bearer {self.graph_token['access_token']}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-            timeout=DEFAULT_TIMEOUT,
+            headers={**self._auth_headers, "Accept": accept},
+            json=payload,
         )
 
         acceptable_codes: list = [200, 201, 202]
@@ -214,21 +331,67 @@ class SpoController:
             return False
         return True
 
-    def get_dir_id(self, directory: str) -> str:
+    def _read_dir_id_cache(self, directory: str) -> str:
+        """
+        Reads the cached SharePoint Online ID for the given directory
+        endpoint, if one was stored by a previous run.
+
+        Args:
+            directory (str): Directory endpoint the ID was cached under.
+
+        Returns:
+            str: Cached ID for the directory, or an empty string.
+        """
+        try:
+            with open(DIR_ID_CACHE_PATH, "r", encoding="utf-8") as cache_file:
+                return json.load(cache_file).get(directory, "")
+        except (OSError, ValueError):
+            return ""
+
+    def _write_dir_id_cache(self, directory: str, dir_id: str) -> None:
+        """
+        Stores the SharePoint Online ID for the given directory endpoint so
+        subsequent runs can skip the lookup round trip.
+
+        Args:
+            directory (str): Directory endpoint to cache the ID under.
+            dir_id (str): ID to cache.
+        """
+        try:
+            with open(DIR_ID_CACHE_PATH, "w", encoding="utf-8") as cache_file:
+                json.dump({directory: dir_id}, cache_file)
+        except OSError as error:
+            logger.error("Unable to persist the directory ID cache: %s", error)
+
+    def get_dir_id(self, directory: str = "", refresh: bool = False) -> str:
         """
         Gets the SharePoint Online ID for a given directory to be used for
-        subsequent uploads.
+        subsequent uploads. Defaults to the directory backing the configured
+        endpoint if nothing is passed. The ID is cached on disk between runs;
+        pass refresh to force a live lookup when a cached ID turns out stale.
 
         Args:
             directory (str): Name of the directory to get the ID for.
+            refresh (bool): Whether to bypass the on-disk cache.
 
         Returns:
             str: ID for the given directory.
         """
+        if not directory:
+            directory = self._dir_endpoint
+        if not refresh:
+            cached: str = self._read_dir_id_cache(directory)
+            if cached:
+                logger.debug("Using the cached directory ID for: %s", directory)
+                return cached
+        logger.debug("Directory endpoint is: %s", directory)
         full_response: dict = self.query_graph(directory)
         if "error" in full_response:
             logger.error("Failure: %s", full_response["error"])
-        return full_response.get("id", "")
+        dir_id: str = full_response.get("id", "")
+        if dir_id:
+            self._write_dir_id_cache(directory, dir_id)
+        return dir_id
 
     def _get_upload_url(self, dir_id: str, file_name: str) -> str:
         """
@@ -241,8 +404,9 @@ class SpoController:
         Returns:
             str: URL to use for the upload session.
         """
-        base_url: str = self.endpoint.split("/root:", maxsplit=1)[0]
-        endpoint: str = f"{base_url}/items/{dir_id}:/{file_name}:/createUploadSession"
+        endpoint: str = (
+            f"{self._base_url}/items/{dir_id}:/{file_name}:/createUploadSession"
+        )
         file_desc: str = "Dashboard script repository archive."
         logger.debug("Getting upload URL from endpoint: %s", endpoint)
         url_payload: dict = {
@@ -252,26 +416,91 @@ class SpoController:
             "name": file_name,
         }
 
-        resp: requests.Response = requests.post(
+        resp: httpx.Response = self._request_with_retry(
+            "POST",
             endpoint,
-            headers={
-                "Authorization": f"Bearer {self.graph_token['access_token']}",
-                "Content-Type": "application/json",
-            },
+            headers={**self._auth_headers, "Content-Type": "application/json"},
             json=url_payload,
-            timeout=DEFAULT_TIMEOUT,
         )
 
+        self._stale_dir_id = resp.status_code == 404
         if not resp.status_code in [200, 201]:
             logger.error(
                 "Failed to get an upload URL with status code: %s", resp.status_code
             )
         return resp.json().get("uploadUrl", "")
 
+    def _pick_chunk_size(self, file_size: int) -> int:
+        """
+        Picks the upload chunk size for a file of the given size. Larger
+        chunks mean fewer round trips for large archives, so the size scales
+        with the file between the minimum and maximum bounds, snapped down to
+        the 320 KiB multiple that Graph requires. The SPOBKP_CHUNK_MIB
+        environment variable overrides the computed size.
+
+        Args:
+            file_size (int): Total size of the file in bytes.
+
+        Returns:
+            int: Chunk size to use in bytes.
+        """
+        override: str = os.environ.get("SPOBKP_CHUNK_MIB", "")
+        if override.isdigit() and int(override) > 0:
+            chunk_size: int = int(override) * 1048576
+        else:
+            chunk_size = min(max(MIN_CHUNK_SIZE, file_size // 32), MAX_CHUNK_SIZE)
+        return max(chunk_size - chunk_size % CHUNK_ALIGNMENT, CHUNK_ALIGNMENT)
+
+    def _upload_chunk(
+        self, endpoint: str, mapped: mmap.mmap, start: int, size: int, headers: dict
+    ) -> bool:
+        """
+        Uploads a single chunk of the mapped file to the given endpoint. The
+        chunk is sliced from the mapping as a memoryview and materialized once
+        for the request body, so no second read buffer is allocated.
+
+        Args:
+            endpoint (str): Endpoint to upload the chunk to.
+            mapped (mmap): Read-only memory mapping of the file being uploaded.
+            start (int): Byte offset where this chunk begins.
+            size (int): Number of bytes in this chunk.
+            headers (dict): Prebuilt headers carrying the auth, length, and
+                            range values for this chunk.
+
+        Returns:
+            bool: Whether or not the chunk was successfully uploaded.
+        """
+        acceptable_codes: list = [200, 201, 202]
+        chunk: memoryview = memoryview(mapped)[start : start + size]
+        try:
+            logger.debug(
+                "Bytes read: %s -- Upload range: %s",
+                size,
+                headers["Content-Range"],
+            )
+            resp: httpx.Response = self._request_with_retry(
+                "PUT",
+                endpoint,
+                headers=headers,
+                content=bytes(chunk),
+            )
+        finally:
+            chunk.release()
+
+        if not resp.status_code in acceptable_codes:
+            logger.error(
+                "Failed to upload the chunk with status code: %s",
+                resp.status_code,
+            )
+            return False
+        return True
+
     def _manage_file_chunks(self, endpoint: str, file_path: str) -> bool:
         """
         Manages the breaking of a file into discrete chunks that SharePoint Online
-        will permit to be uploaded and then upload them.
+        will permit to be uploaded and then upload them. Chunks cover
+        non-overlapping byte ranges, which the Graph upload session allows to be
+        sent concurrently, so they are uploaded through a bounded thread pool.
 
         Args:
             endpoint (str): Endpoint to upload the file to.
@@ -280,45 +509,108 @@ class SpoController:
         Returns:
             bool: Whether or not the file was successfully uploaded.
         """
-        acceptable_codes: list = [200, 201, 202]
         file_stats: os.stat_result = os.stat(file_path)
         file_size: int = file_stats.st_size
-        chunks: int = int(file_size / CHUNK_SIZE) + 1
-        logger.debug("File will be broken into %s chunks.", chunks)
-        with open(file_path, "rb") as file_data:
-            start: int = 0
-            for chunk_num in range(chunks):
-                chunk: bytes = file_data.read(CHUNK_SIZE)
-                bytes_read: int = len(chunk)
-                upload_range: str = (
-                    f"bytes {start}-{start + bytes_read - 1}/{file_size}"
-                )
-                logger.debug(
-                    "Chunk: %s -- Bytes read: %s -- Upload range: %s",
-                    chunk_num,
-                    bytes_read,
-                    upload_range,
-                )
-                resp: requests.Response = requests.put(
-                    endpoint,
-                    headers={
-                        "Content-Length": str(bytes_read),
-                        "Content-Range": upload_range,
+        if file_size == 0:
+            logger.error("Refusing to upload an empty file: %s", file_path)
+            return False
+        chunk_size: int = self._pick_chunk_size(file_size)
+        chunks: int = -(-file_size // chunk_size)
+        logger.debug(
+            "File will be broken into %s chunks of up to %s bytes.",
+            chunks,
+            chunk_size,
+        )
+        ranges: list = []
+        for chunk_num in range(chunks):
+            start: int = chunk_num * chunk_size
+            size: int = min(chunk_size, file_size - start)
+            ranges.append(
+                (
+                    start,
+                    size,
+                    {
+                        **self._auth_headers,
+                        "Content-Length": str(size),
+                        "Content-Range": f"bytes {start}-{start + size - 1}/{file_size}",
                     },
-                    data=chunk,
-                    timeout=DEFAULT_TIMEOUT,
                 )
+            )
 
-                if not resp.status_code in acceptable_codes:
-                    logger.error(
-                        "Failed to upload the chunk with status code: %s",
-                        resp.status_code,
-                    )
-                    return False
-                start += bytes_read
+        fd: int = os.open(file_path, os.O_RDONLY)
+        try:
+            mapped: mmap.mmap = mmap.mmap(fd, file_size, prot=mmap.PROT_READ)
+            try:
+                with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as pool:
+                    futures: list = [
+                        pool.submit(
+                            self._upload_chunk, endpoint, mapped, start, size, headers
+                        )
+                        for start, size, headers in ranges
+                    ]
+                    for future in as_completed(futures):
+                        if not future.result():
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            return False
+            finally:
+                mapped.close()
+        finally:
+            os.close(fd)
+        logger.info("Completed the file upload.")
+        return True
+
+    def _upload_small_file(self, dir_id: str, file_path: str, file_name: str) -> bool:
+        """
+        Uploads a file below the upload-session threshold with a single PUT to
+        the /content endpoint, skipping the createUploadSession round trip
+        entirely.
+
+        Args:
+            dir_id (str): ID of the directory to upload to.
+            file_path (str): Local path to the file to upload.
+            file_name (str): Name of the file being uploaded.
+
+        Returns:
+            bool: Whether or not the upload was successful.
+        """
+        endpoint: str = f"{self._base_url}/items/{dir_id}:/{file_name}:/content"
+        logger.debug("Uploading the file in a single request to: %s", endpoint)
+        with open(file_path, "rb") as file_data:
+            content: bytes = file_data.read()
+
+        resp: httpx.Response = self._request_with_retry(
+            "PUT",
+            endpoint,
+            headers={
+                **self._auth_headers,
+                "Content-Type": "application/octet-stream",
+            },
+            content=content,
+        )
+
+        self._stale_dir_id = resp.status_code == 404
+        if not resp.status_code in [200, 201]:
+            logger.error(
+                "Failed to upload the file with status code: %s", resp.status_code
+            )
+            return False
         logger.info("Completed the file upload.")
         return True
 
+    def _refresh_stale_dir_id(self) -> str:
+        """
+        Re-resolves the directory ID after an upload attempt came back with a
+        404, which usually means the cached ID no longer exists.
+
+        Returns:
+            str: Freshly looked-up directory ID, or an empty string if the
+                    failure was not a stale ID.
+        """
+        if not self._stale_dir_id:
+            return ""
+        logger.info("The cached directory ID looks stale. Refreshing it.")
+        return self.get_dir_id(refresh=True)
+
     def upload_file(self, dir_id: str, file_path: str, file_name: str) -> bool:
         """
         Uploads a file to SharePoint Online.
@@ -334,7 +626,21 @@ class SpoController:
         logger.debug(
             "Attempting to upload file %s to directory ID: %s", file_name, dir_id
         )
+        file_size: int = os.stat(file_path).st_size
+        if file_size < SIMPLE_UPLOAD_LIMIT:
+            if self._upload_small_file(dir_id, file_path, file_name):
+                return True
+            dir_id = self._refresh_stale_dir_id()
+            if not dir_id:
+                return False
+            return self._upload_small_file(dir_id, file_path, file_name)
+
         upload_url: str = self._get_upload_url(dir_id, file_name)
+        if not upload_url:
+            dir_id = self._refresh_stale_dir_id()
+            if not dir_id:
+                return False
+            upload_url = self._get_upload_url(dir_id, file_name)
         logger.info("Using the following upload URL: %s", upload_url)
         if not upload_url:
             return False
@@ -352,15 +658,13 @@ class SpoController:
         Returns:
             bool: Whether or not the item was successfully deleted.
         """
-        endpoint: str = (
-            f'{self.endpoint.split("/root:", maxsplit=1)[0]}/items/{item_id}'
-        )
+        endpoint: str = f"{self._base_url}/items/{item_id}"
         logger.info("Deleting an old backup with the following URL: %s", endpoint)
 
-        resp: requests.Response = requests.delete(
+        resp: httpx.Response = self._request_with_retry(
+            "DELETE",
             endpoint,
-            headers={"Authorization": f"Bearer {self.graph_token['access_token']}"},
-            timeout=DEFAULT_TIMEOUT,
+            headers=self._auth_headers,
         )
 
         if resp.status_code != 204:
@@ -372,46 +676,40 @@ class SpoController:
 
     def cleanup_files(self) -> None:
         """
-        Cleans up the content in a given SharePoint Online directory.
+        Cleans up the content in a given SharePoint Online directory by
+        deleting the oldest files beyond the backup retention limit.
         """
         logger.info("Doing cleanup on the following directory: %s", self.endpoint)
 
-        dir_content: list = self.query_graph(self.endpoint).get("value", [])
+        dir_content: list = self.query_graph(self._listing_endpoint).get("value", [])
         logger.debug("Found %s items in the directory.", len(dir_content))
+        if len(dir_content) <= MAX_BACKUPS:
+            return
 
-        oldest_filename: str = ""
-        oldest_id: str = ""
-        right_now = datetime.utcnow()
-
-        while len(dir_content) > MAX_BACKUPS:
-            oldest_timestamp: datetime = datetime(
-                right_now.year + 1, right_now.month, right_now.day, 0, 0, 0
-            )
-            for single_file in dir_content:
-                try:
-                    current_file_time: datetime = datetime.strptime(
-                        single_file.get("createdDateTime", ""), "%Y-%m-%dT%H:%M:%SZ"
-                    )
-                    if current_file_time < oldest_timestamp:
-                        oldest_timestamp = current_file_time
-                        oldest_filename = single_file.get("name", "")
-                        oldest_id = single_file.get("id", "")
-                except ValueError:
-                    logger.error(
-                        "Unable to parse the following to a datetime: %s",
-                        single_file.get("createdDateTime", ""),
+        dated_files: list = []
+        for single_file in dir_content:
+            try:
+                created: datetime = datetime.fromisoformat(
+                    single_file.get("createdDateTime", "")
+                )
+            except ValueError:
+                logger.error(
+                    "Unable to parse the following to a datetime: %s",
+                    single_file.get("createdDateTime", ""),
+                )
+                continue
+            dated_files.append((created, single_file))
+
+        dated_files.sort(key=itemgetter(0))
+        to_delete: list = dated_files[:-MAX_BACKUPS]
+        logger.info("Deleting the oldest %s files.", len(to_delete))
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as pool:
+            futures: dict = {
+                pool.submit(self._delete_file, single_file.get("id", "")): single_file
+                for _, single_file in to_delete
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    logger.info(
+                        "Deleted old backup: %s", futures[future].get("name", "")
                     )
-
-            logger.info(
-                "Oldest file was %s with a timestamp of: %s. It will be deleted.",
-                oldest_filename,
-                oldest_timestamp,
-            )
-            if not self._delete_file(oldest_id):
-                break
-
-            match: dict = next(
-                (file for file in dir_content if file["id"] == oldest_id), {}
-            )
-            if match:
-                dir_content.remove(match)